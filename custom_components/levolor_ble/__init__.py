@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
@@ -20,10 +20,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Levolor BLE Blinds from a config entry."""
     address = entry.data[CONF_ADDRESS]
 
-    coordinator = LevolorBLECoordinator(hass, address)
-
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    # Share one coordinator per physical remote so entries for different
+    # channels funnel through a single lock and BLE connection
+    coordinators = hass.data.setdefault(DOMAIN, {})
+    if address not in coordinators:
+        coordinators[address] = LevolorBLECoordinator(hass, address)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -34,7 +35,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        address = entry.data[CONF_ADDRESS]
+        # Only drop the shared coordinator once no other loaded entry still
+        # uses this remote
+        if not any(
+            other.entry_id != entry.entry_id
+            and other.data.get(CONF_ADDRESS) == address
+            and other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+        ):
+            coordinator: LevolorBLECoordinator = hass.data[DOMAIN].pop(address)
+            await coordinator.async_shutdown()
         _LOGGER.info("Levolor BLE integration unloaded")
 
     return unload_ok
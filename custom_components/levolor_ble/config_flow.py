@@ -17,6 +17,16 @@ from .const import CONF_BLIND_NAME, CONF_CHANNEL, DOMAIN, LEVOLOR_DEVICE_NAME
 
 _LOGGER = logging.getLogger(__name__)
 
+# Built once at import: both channel-selection forms render the same schema,
+# so there is no need to rebuild the validator per form render
+_CHANNEL_OPTIONS = {channel: f"Channel {channel}" for channel in range(1, 7)}
+_CHANNEL_NAME_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_BLIND_NAME, default="Levolor Blind"): str,
+        vol.Required(CONF_CHANNEL, default=1): vol.In(_CHANNEL_OPTIONS),
+    }
+)
+
 
 class LevolorBLEConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Levolor BLE Blinds."""
@@ -59,15 +69,7 @@ class LevolorBLEConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="bluetooth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_BLIND_NAME, default="Levolor Blind"): str,
-                    vol.Required(CONF_CHANNEL, default=1): vol.In(
-                        {1: "Channel 1", 2: "Channel 2", 3: "Channel 3",
-                         4: "Channel 4", 5: "Channel 5", 6: "Channel 6"}
-                    ),
-                }
-            ),
+            data_schema=_CHANNEL_NAME_SCHEMA,
             description_placeholders={
                 "name": self._discovery_info.name or "Levolor",
                 "address": self._discovery_info.address,
@@ -89,10 +91,16 @@ class LevolorBLEConfigFlow(ConfigFlow, domain=DOMAIN):
             self._discovery_info = self._discovered_devices.get(address)
             return await self.async_step_configure()
 
-        # Scan for available Levolor devices
-        self._discovered_devices = {}
+        # Scan for available Levolor devices, skipping addresses that are
+        # already configured or collected by an earlier render of this form
+        current_addresses = self._async_current_ids()
         for discovery in async_discovered_service_info(self.hass, connectable=True):
-            if discovery.name and LEVOLOR_DEVICE_NAME in discovery.name:
+            if (
+                discovery.address in self._discovered_devices
+                or discovery.address in current_addresses
+            ):
+                continue
+            if (name := discovery.name) and name.startswith(LEVOLOR_DEVICE_NAME):
                 self._discovered_devices[discovery.address] = discovery
 
         if not self._discovered_devices:
@@ -131,13 +139,5 @@ class LevolorBLEConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="configure",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_BLIND_NAME, default="Levolor Blind"): str,
-                    vol.Required(CONF_CHANNEL, default=1): vol.In(
-                        {1: "Channel 1", 2: "Channel 2", 3: "Channel 3",
-                         4: "Channel 4", 5: "Channel 5", 6: "Channel 6"}
-                    ),
-                }
-            ),
+            data_schema=_CHANNEL_NAME_SCHEMA,
         )
@@ -17,7 +17,9 @@ CMD_PREFIX = 0xF1
 
 # Connection settings
 DEFAULT_RETRY_COUNT = 3
-COMMAND_DELAY = 0.3  # seconds to wait after command before disconnect
+IDLE_DISCONNECT_DELAY = 30.0  # seconds to keep the connection open after last command
+MAX_BACKOFF_DELAY = 8.0  # cap for the exponential retry backoff in seconds
+ADVERTISEMENT_MAX_AGE = 60.0  # seconds an advertisement counts as proof of presence
 
 
 class Action(IntEnum):
@@ -31,6 +33,15 @@ class Action(IntEnum):
     STOP = 0x06
 
 
+# Pre-built command payloads ([PREFIX] [ACTION] [CHANNEL]) for all 6 actions
+# x 6 channels, so the send path never builds bytes on the fly
+COMMAND_PAYLOADS: dict[tuple[int, int], bytes] = {
+    (action, channel): bytes([CMD_PREFIX, action, channel])
+    for action in Action
+    for channel in range(1, 7)
+}
+
+
 # Config entry keys
 CONF_ADDRESS = "address"
 CONF_CHANNEL = "channel"
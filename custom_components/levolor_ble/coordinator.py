@@ -4,21 +4,29 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import time
+from collections import defaultdict
 
 from bleak import BleakClient
+from bleak.backends.device import BLEDevice
+from bleak.backends.service import BleakGATTServiceCollection
 from bleak.exc import BleakError
+from bleak_retry_connector import establish_connection
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
-    CMD_PREFIX,
+    ADVERTISEMENT_MAX_AGE,
     COMMAND_CHAR_UUID,
-    COMMAND_DELAY,
+    COMMAND_PAYLOADS,
     DEFAULT_RETRY_COUNT,
+    IDLE_DISCONNECT_DELAY,
     INIT_CHAR_UUID,
     INIT_PAYLOAD,
     LEVOLOR_DEVICE_NAME,
+    MAX_BACKOFF_DELAY,
     Action,
 )
 
@@ -32,47 +40,166 @@ class LevolorBLECoordinator:
         """Initialize the coordinator."""
         self.hass = hass
         self.address = address
-        self._lock = asyncio.Lock()
+        # The radio lock serializes actual BLE access; per-channel locks
+        # scope command bookkeeping so unrelated channels never queue on
+        # each other outside the radio itself
+        self._radio_lock = asyncio.Lock()
+        self._channel_locks: defaultdict[int, asyncio.Lock] = defaultdict(
+            asyncio.Lock
+        )
+        self._client: BleakClient | None = None
+        self._disconnect_handle: asyncio.TimerHandle | None = None
+        self._idle_timeout = IDLE_DISCONNECT_DELAY
+        self._ble_device: BLEDevice | None = None
+        self._write_with_response = True
+        self._init_without_response = False
+        self._init_sent = False
+        self._pending: dict[tuple[int, int], asyncio.Future[bool]] = {}
+        self._cached_services: BleakGATTServiceCollection | None = None
+        # Track the remote's advertisements so commands never need to
+        # search the discovered-device list
+        self._cancel_adv_callback = bluetooth.async_register_callback(
+            hass,
+            self._async_adv_seen,
+            {"address": address, "connectable": True},
+            bluetooth.BluetoothScanningMode.PASSIVE,
+        )
+
+    @callback
+    def _async_adv_seen(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Cache the BLEDevice whenever the remote advertises."""
+        self._ble_device = service_info.device
 
     async def async_send_command(
         self, action: Action, channel: int, retry_count: int = DEFAULT_RETRY_COUNT
     ) -> bool:
         """Send a command to the Levolor remote with retry logic."""
-        async with self._lock:
-            for attempt in range(retry_count):
-                try:
-                    success = await self._send_command_once(action, channel)
-                    if success:
-                        return True
-                except (BleakError, TimeoutError) as err:
-                    _LOGGER.warning(
-                        "Attempt %d/%d failed for %s channel %d: %s",
-                        attempt + 1,
-                        retry_count,
-                        action.name,
-                        channel,
-                        err,
-                    )
-                    if attempt < retry_count - 1:
-                        await asyncio.sleep(1.0)
+        if not 1 <= channel <= 6:
+            raise HomeAssistantError(f"Invalid channel: {channel}. Must be 1-6.")
 
-            _LOGGER.error(
-                "Failed to send %s to channel %d after %d attempts",
+        # Coalesce duplicate commands: callers arriving while the same
+        # (action, channel) is still in flight share its result instead of
+        # triggering a redundant radio transmission
+        key = (int(action), channel)
+        if (pending := self._pending.get(key)) is not None:
+            _LOGGER.debug(
+                "%s for channel %d already in flight, sharing result",
                 action.name,
                 channel,
-                retry_count,
             )
-            return False
+            return await pending
+
+        fut: asyncio.Future[bool] = self.hass.loop.create_future()
+        self._pending[key] = fut
+        try:
+            async with self._channel_locks[channel]:
+                result = False
+                for attempt in range(retry_count):
+                    try:
+                        async with self._radio_lock:
+                            result = await self._send_command_once(action, channel)
+                        break
+                    except (BleakError, TimeoutError) as err:
+                        # A reused connection may have gone stale mid-write;
+                        # drop it so the next attempt reconnects fresh
+                        async with self._radio_lock:
+                            await self._async_reset_client()
+                        if attempt == retry_count - 1:
+                            _LOGGER.error(
+                                "Failed to send %s to channel %d after %d "
+                                "attempts: %s",
+                                action.name,
+                                channel,
+                                retry_count,
+                                err,
+                            )
+                            break
+                        # Exponential backoff with +-10% jitter to avoid
+                        # hammering a congested radio channel in lockstep
+                        delay = min(
+                            (2**attempt) * (0.9 + random.random() * 0.2),
+                            MAX_BACKOFF_DELAY,
+                        )
+                        _LOGGER.debug(
+                            "Attempt %d/%d failed for %s channel %d (%s); "
+                            "retrying in %.1f s",
+                            attempt + 1,
+                            retry_count,
+                            action.name,
+                            channel,
+                            err,
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
+            fut.set_result(result)
+            return result
+        finally:
+            del self._pending[key]
+            # Resolve the shared future on every exit path - including
+            # cancellation - so coalesced waiters never hang on it
+            if not fut.done():
+                fut.set_result(False)
 
     async def _send_command_once(self, action: Action, channel: int) -> bool:
         """Send a single command to the remote."""
-        # Get BLE device from Home Assistant's Bluetooth integration
-        ble_device = bluetooth.async_ble_device_from_address(
-            self.hass, self.address, connectable=True
-        )
+        client = await self._async_get_client()
+
+        try:
+            # Initialize RF transmitter; once armed the remote stays armed
+            # for the life of the connection, so skip it on warm sessions.
+            # Submit without response, when the characteristic supports it,
+            # so command preparation overlaps the init write.
+            init_task = None
+            if not self._init_sent:
+                _LOGGER.debug("Sending initialization payload")
+                init_task = asyncio.create_task(
+                    client.write_gatt_char(
+                        INIT_CHAR_UUID,
+                        INIT_PAYLOAD,
+                        response=not self._init_without_response,
+                    )
+                )
+
+            # Look up the pre-built command payload
+            command = COMMAND_PAYLOADS[(action, channel)]
+            _LOGGER.debug(
+                "Sending %s to channel %d: %s", action.name, channel, command.hex()
+            )
+
+            if init_task is not None:
+                await init_task
+                self._init_sent = True
+            await client.write_gatt_char(
+                COMMAND_CHAR_UUID, command, response=self._write_with_response
+            )
+
+            _LOGGER.info("Successfully sent %s to channel %d", action.name, channel)
+            return True
+        finally:
+            self._schedule_disconnect()
+
+    async def _async_get_client(self) -> BleakClient:
+        """Return a connected client, reusing the persistent connection if alive."""
+        if self._client is not None and self._client.is_connected:
+            return self._client
+        self._client = None
+        self._init_sent = False
+
+        # Prefer the device cached from the advertisement callback
+        ble_device = self._ble_device
+
+        if not ble_device:
+            # Fall back to Home Assistant's Bluetooth integration lookup
+            ble_device = bluetooth.async_ble_device_from_address(
+                self.hass, self.address, connectable=True
+            )
 
         if not ble_device:
-            # Try to find device by name if address not found
+            # Last resort: the remote may have changed address
             ble_device = await self._find_device_by_name()
 
         if not ble_device:
@@ -81,28 +208,72 @@ class LevolorBLECoordinator:
                 "Ensure it's powered on and nearby."
             )
 
-        async with BleakClient(ble_device) as client:
-            # Initialize RF transmitter
-            _LOGGER.debug("Sending initialization payload")
-            await client.write_gatt_char(INIT_CHAR_UUID, INIT_PAYLOAD)
+        # Single attempt here: async_send_command's retry loop owns retries
+        # and backoff, so letting establish_connection retry as well would
+        # multiply the layers into retry_count^2 connect attempts
+        self._client = await establish_connection(
+            BleakClient,
+            ble_device,
+            f"Levolor-{self.address}",
+            max_attempts=1,
+            use_services_cache=True,
+            cached_services=self._cached_services,
+        )
 
-            # Build and send command
-            command = bytes([CMD_PREFIX, action, channel])
-            _LOGGER.debug(
-                "Sending %s to channel %d: %s", action.name, channel, command.hex()
-            )
+        # Keep the resolved services so reconnects skip GATT discovery
+        self._cached_services = self._client.services
 
-            try:
-                await client.write_gatt_char(COMMAND_CHAR_UUID, command, response=True)
-            except BleakError:
-                # Fall back to write without response
-                await client.write_gatt_char(COMMAND_CHAR_UUID, command, response=False)
+        # Determine the supported write modes once instead of falling back
+        # from a failed write-with-response on every command
+        char = self._client.services.get_characteristic(COMMAND_CHAR_UUID)
+        self._write_with_response = char is not None and "write" in char.properties
+        init_char = self._client.services.get_characteristic(INIT_CHAR_UUID)
+        self._init_without_response = (
+            init_char is not None
+            and "write-without-response" in init_char.properties
+        )
 
-            # Allow remote to process before disconnect
-            await asyncio.sleep(COMMAND_DELAY)
+        return self._client
 
-            _LOGGER.info("Successfully sent %s to channel %d", action.name, channel)
-            return True
+    async def _async_reset_client(self) -> None:
+        """Drop a possibly stale client so the next attempt reconnects."""
+        if self._client is None:
+            return
+        client, self._client = self._client, None
+        self._init_sent = False
+        try:
+            await client.disconnect()
+        except BleakError:
+            pass
+
+    def _schedule_disconnect(self) -> None:
+        """(Re)arm the idle timer that tears down the persistent connection."""
+        if self._disconnect_handle is not None:
+            self._disconnect_handle.cancel()
+        self._disconnect_handle = self.hass.loop.call_later(
+            self._idle_timeout, self._idle_timer_fired
+        )
+
+    @callback
+    def _idle_timer_fired(self) -> None:
+        """Clear the expired timer handle and start the disconnect task."""
+        self._disconnect_handle = None
+        self.hass.async_create_task(self._async_disconnect())
+
+    async def _async_disconnect(self) -> None:
+        """Disconnect the persistent connection after the idle timeout."""
+        async with self._radio_lock:
+            if self._disconnect_handle is not None:
+                # The timer was re-armed by a command that held the radio
+                # lock while this task waited, so the connection is no
+                # longer idle - leave it alone
+                return
+            if self._client is None:
+                return
+            _LOGGER.debug("Disconnecting after %.0f s idle", self._idle_timeout)
+            client, self._client = self._client, None
+            self._init_sent = False
+            await client.disconnect()
 
     async def _find_device_by_name(self):
         """Find Levolor device by name when address lookup fails."""
@@ -111,17 +282,40 @@ class LevolorBLECoordinator:
             self.hass, connectable=True
         )
         for discovery in discoveries:
-            if discovery.name and LEVOLOR_DEVICE_NAME in discovery.name:
+            # The remote always advertises a "Levolor" name prefix, so a
+            # startswith check beats a substring scan in this tight loop
+            if (name := discovery.name) and name.startswith(LEVOLOR_DEVICE_NAME):
                 _LOGGER.info(
                     "Found Levolor device at new address: %s", discovery.address
                 )
                 self.address = discovery.address
+                self._ble_device = discovery.device
                 return discovery.device
         return None
 
+    async def async_shutdown(self) -> None:
+        """Release callbacks and the connection when the entry unloads."""
+        self._cancel_adv_callback()
+        if self._disconnect_handle is not None:
+            self._disconnect_handle.cancel()
+            self._disconnect_handle = None
+        if self._client is not None:
+            client, self._client = self._client, None
+            self._init_sent = False
+            await client.disconnect()
+
     async def async_test_connection(self) -> bool:
         """Test if we can connect to the device."""
-        ble_device = bluetooth.async_ble_device_from_address(
+        # A recent advertisement already proves the remote is reachable, so
+        # skip the connect-and-write probe and its full GATT discovery
+        last = bluetooth.async_last_service_info(
+            self.hass, self.address, connectable=True
+        )
+        if last is not None and time.monotonic() - last.time < ADVERTISEMENT_MAX_AGE:
+            _LOGGER.debug("Recent advertisement found, skipping connection probe")
+            return True
+
+        ble_device = self._ble_device or bluetooth.async_ble_device_from_address(
             self.hass, self.address, connectable=True
         )
 
@@ -132,10 +326,19 @@ class LevolorBLECoordinator:
             return False
 
         try:
-            async with BleakClient(ble_device) as client:
+            client = await establish_connection(
+                BleakClient,
+                ble_device,
+                f"Levolor-{self.address}",
+                use_services_cache=True,
+                cached_services=self._cached_services,
+            )
+            try:
                 # Just try to send init to verify connection works
                 await client.write_gatt_char(INIT_CHAR_UUID, INIT_PAYLOAD)
                 return True
-        except BleakError as err:
+            finally:
+                await client.disconnect()
+        except (BleakError, TimeoutError) as err:
             _LOGGER.debug("Connection test failed: %s", err)
             return False
@@ -29,7 +29,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Levolor BLE cover from a config entry."""
-    coordinator: LevolorBLECoordinator = hass.data[DOMAIN][entry.entry_id]
+    # Coordinators are shared per remote address, not per entry
+    coordinator: LevolorBLECoordinator = hass.data[DOMAIN][entry.data[CONF_ADDRESS]]
 
     async_add_entities(
         [
@@ -102,11 +103,16 @@ class LevolorBlindCover(CoverEntity, RestoreEntity):
         """Open the blind."""
         self._attr_is_opening = True
         self._attr_is_closing = False
-        self.async_write_ha_state()
+        # Defer the "opening" feedback write so fast commands only pay for
+        # the final state write; slow ones still show movement after 50 ms
+        delayed_write = self.hass.loop.call_later(0.05, self.async_write_ha_state)
 
-        success = await self._coordinator.async_send_command(
-            Action.OPEN, self._channel
-        )
+        try:
+            success = await self._coordinator.async_send_command(
+                Action.OPEN, self._channel
+            )
+        finally:
+            delayed_write.cancel()
 
         self._attr_is_opening = False
         if success:
@@ -122,11 +128,14 @@ class LevolorBlindCover(CoverEntity, RestoreEntity):
         """Close the blind."""
         self._attr_is_closing = True
         self._attr_is_opening = False
-        self.async_write_ha_state()
+        delayed_write = self.hass.loop.call_later(0.05, self.async_write_ha_state)
 
-        success = await self._coordinator.async_send_command(
-            Action.CLOSE, self._channel
-        )
+        try:
+            success = await self._coordinator.async_send_command(
+                Action.CLOSE, self._channel
+            )
+        finally:
+            delayed_write.cancel()
 
         self._attr_is_closing = False
         if success:
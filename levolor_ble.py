@@ -87,34 +87,63 @@ class LevolorRemote:
         """
         Scan for Levolor devices.
 
+        Matches are collected via a detection callback and the scan returns
+        1 second after the last new match instead of always waiting out the
+        full timeout.
+
         Args:
-            timeout: Scan duration in seconds.
+            timeout: Maximum scan duration in seconds.
 
         Returns:
             List of discovered Levolor devices.
         """
-        logger.info(f"Scanning for Levolor devices ({timeout}s)...")
-        devices = []
+        logger.info(f"Scanning for Levolor devices (up to {timeout}s)...")
+        loop = asyncio.get_running_loop()
+        seen = {}
+        done = asyncio.Event()
+        debounce_handle = None
+
+        def detection_callback(device, advertisement_data):
+            nonlocal debounce_handle
+            if not (device.name and LEVOLOR_DEVICE_NAME in device.name):
+                return
+            if device.address in seen:
+                # Repeat advertisements must not reset the debounce, or a
+                # fast-advertising remote would pin the scan to the full
+                # timeout
+                return
+            # Emit each device the moment it is first seen, keyed by
+            # address, so short-lived advertisers are not missed
+            seen[device.address] = device
+            logger.info(f"Found: {device.name} ({device.address})")
+            # Finish once no new match has arrived for 1 second
+            if debounce_handle is not None:
+                debounce_handle.cancel()
+            debounce_handle = loop.call_later(1.0, done.set)
 
-        async with BleakScanner() as scanner:
-            await asyncio.sleep(timeout)
-            discovered = scanner.discovered_devices
+        async with BleakScanner(detection_callback=detection_callback):
+            try:
+                await asyncio.wait_for(done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
 
-        for device in discovered:
-            if device.name and LEVOLOR_DEVICE_NAME in device.name:
-                logger.info(f"Found: {device.name} ({device.address})")
-                devices.append(device)
+        if debounce_handle is not None:
+            debounce_handle.cancel()
 
-        if not devices:
+        if not seen:
             logger.warning("No Levolor devices found")
 
-        return devices
+        return list(seen.values())
 
     @staticmethod
     async def find_device(timeout: float = 10.0):
         """
         Find the first Levolor device.
 
+        Tries a short passive scan first - the remote advertises its name,
+        so no SCAN_REQ traffic is needed - and falls back to an active scan
+        if nothing turns up or the backend lacks passive support.
+
         Args:
             timeout: Scan duration in seconds.
 
@@ -123,10 +152,24 @@ class LevolorRemote:
         """
         logger.info(f"Searching for Levolor device ({timeout}s)...")
 
-        device = await BleakScanner.find_device_by_filter(
-            lambda d, _: d.name and LEVOLOR_DEVICE_NAME in d.name,
-            timeout=timeout
-        )
+        def is_levolor(d, _):
+            return bool(d.name and LEVOLOR_DEVICE_NAME in d.name)
+
+        device = None
+        try:
+            device = await BleakScanner.find_device_by_filter(
+                is_levolor,
+                timeout=min(3.0, timeout),
+                scanning_mode="passive"
+            )
+        except BleakError as e:
+            logger.debug(f"Passive scan unavailable: {e}")
+
+        if device is None:
+            device = await BleakScanner.find_device_by_filter(
+                is_levolor,
+                timeout=timeout
+            )
 
         if device:
             logger.info(f"Found: {device.name} ({device.address})")
@@ -145,6 +188,11 @@ class LevolorRemote:
         Returns:
             True if connection successful, False otherwise.
         """
+        # Reuse an existing connection outright
+        if self.client is not None and self.client.is_connected:
+            logger.debug("Already connected")
+            return True
+
         if self.address is None:
             # Find first available device (more efficient than full scan)
             device = await self.find_device(timeout=timeout)
@@ -156,7 +204,10 @@ class LevolorRemote:
         logger.info(f"Connecting to {self.address}...")
 
         try:
-            self.client = BleakClient(self.address)
+            # Reconnect through the existing client when possible instead of
+            # recreating its backend (DBus) objects on every call
+            if self.client is None:
+                self.client = BleakClient(self.address)
             await self.client.connect()
 
             if not self.client.is_connected: